@@ -394,10 +394,24 @@ class IndyLedger(BaseLedger):
 
         """
         if self.cache:
-            result = await self.cache.get(f"schema::{schema_id}")
-            if result:
-                return result
+            async with self.cache.acquire(f"schema::{schema_id}") as entry:
+                if entry.result:
+                    return entry.result
+                schema = await self._fetch_schema(schema_id)
+                if schema:
+                    await entry.set_result(schema, self.cache_duration)
+                return schema
 
+        return await self._fetch_schema(schema_id)
+
+    async def _fetch_schema(self, schema_id: str):
+        """
+        Fetch a schema from the ledger by id or sequence number.
+
+        Args:
+            schema_id: The schema id (or stringified sequence number) to retrieve
+
+        """
         if schema_id.isdigit():
             return await self.fetch_schema_by_seq_no(int(schema_id))
         else:
@@ -587,11 +601,17 @@ class IndyLedger(BaseLedger):
 
         """
         if self.cache:
-            result = await self.cache.get(
+            async with self.cache.acquire(
                 f"credential_definition::{credential_definition_id}"
-            )
-            if result:
-                return result
+            ) as entry:
+                if entry.result:
+                    return entry.result
+                credential_definition = await self.fetch_credential_definition(
+                    credential_definition_id
+                )
+                if credential_definition:
+                    await entry.set_result(credential_definition, self.cache_duration)
+                return credential_definition
 
         return await self.fetch_credential_definition(credential_definition_id)
 
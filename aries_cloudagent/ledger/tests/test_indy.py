@@ -683,6 +683,90 @@ class TestIndyLedger(AsyncTestCase):
 
             assert response is None
 
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._submit")
+    @async_mock.patch("indy.ledger.build_get_schema_request")
+    @async_mock.patch("indy.ledger.parse_get_schema_response")
+    async def test_get_schema_concurrent(
+        self,
+        mock_parse_get_schema_resp,
+        mock_build_get_schema_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_wallet.WALLET_TYPE = "indy"
+        mock_wallet.get_public_did = async_mock.CoroutineMock()
+        mock_did = mock_wallet.get_public_did.return_value
+        mock_did.did = self.test_did
+
+        mock_parse_get_schema_resp.return_value = (None, '{"attrNames": ["a", "b"]}')
+
+        async def submit(request, public_did=None):
+            await asyncio.sleep(0.01)  # suspend so the other caller can queue up
+            return '{"result":{"seqNo":1}}'
+
+        mock_submit.side_effect = submit
+
+        ledger = IndyLedger("name", mock_wallet, cache=BasicCache())
+
+        async with ledger:
+            responses = await asyncio.gather(
+                ledger.get_schema("schema_id"), ledger.get_schema("schema_id")
+            )
+
+            assert mock_submit.call_count == 1
+            assert responses == [
+                json.loads(mock_parse_get_schema_resp.return_value[1])
+            ] * 2
+
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_open")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_close")
+    @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._submit")
+    @async_mock.patch("indy.ledger.build_get_schema_request")
+    @async_mock.patch("indy.ledger.parse_get_schema_response")
+    async def test_get_schema_concurrent_not_found_retry(
+        self,
+        mock_parse_get_schema_resp,
+        mock_build_get_schema_req,
+        mock_submit,
+        mock_close,
+        mock_open,
+    ):
+        mock_wallet = async_mock.MagicMock()
+        mock_wallet.WALLET_TYPE = "indy"
+        mock_wallet.get_public_did = async_mock.CoroutineMock()
+        mock_did = mock_wallet.get_public_did.return_value
+        mock_did.did = self.test_did
+
+        mock_parse_get_schema_resp.return_value = (None, '{"attrNames": ["a", "b"]}')
+
+        submissions = [
+            json.dumps({"result": {"seqNo": None}}),
+            json.dumps({"result": {"seqNo": 1}}),
+        ]
+
+        async def submit(request, public_did=None):
+            await asyncio.sleep(0.01)  # suspend so the other caller can queue up
+            return submissions[mock_submit.call_count - 1]
+
+        mock_submit.side_effect = submit
+
+        ledger = IndyLedger("name", mock_wallet, cache=BasicCache())
+
+        async with ledger:
+            responses = await asyncio.gather(
+                ledger.get_schema("schema_id"), ledger.get_schema("schema_id")
+            )
+
+            assert mock_submit.call_count == 2  # waiter retries after miss
+            assert responses == [
+                None,
+                json.loads(mock_parse_get_schema_resp.return_value[1]),
+            ]
+
     @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_open")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._context_close")
     @async_mock.patch("aries_cloudagent.ledger.indy.IndyLedger._submit")
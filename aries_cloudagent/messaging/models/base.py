@@ -87,6 +87,7 @@ class BaseModel(ABC):
                     self.__class__.__name__
                 )
             )
+        self._orig_dict = None
 
     @classmethod
     def _get_schema_class(cls):
@@ -124,10 +125,15 @@ class BaseModel(ABC):
         """
         schema = cls._get_schema_class()()
         try:
-            return schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
+            model = schema.loads(obj) if isinstance(obj, str) else schema.load(obj)
         except ValidationError as e:
             LOGGER.exception(f"{cls.__name__} message validation error:")
             raise BaseModelError(f"{cls.__name__} schema validation failed") from e
+        if isinstance(obj, dict):
+            # retain a copy of the source dict: callers can then skip
+            # re-serializing as received, with no alias to a mutable input
+            model._orig_dict = dict(obj)
+        return model
 
     def serialize(self, as_string=False) -> dict:
         """
@@ -228,10 +228,14 @@ class BaseRecord(BaseModel):
             None,
             {"retrieveTags": False},
         )
+        if not post_filter:
+            # uniqueness can be checked in storage: no need to fetch all records
+            record = await query.fetch_single()
+            return cls.from_storage(record.id, json.loads(record.value))
         found = None
         async for record in query:
             vals = json.loads(record.value)
-            if not post_filter or match_post_filter(vals, post_filter):
+            if match_post_filter(vals, post_filter):
                 if found:
                     raise StorageDuplicateError("Multiple records located")
                 found = cls.from_storage(record.id, vals)
@@ -300,12 +304,14 @@ class BaseRecord(BaseModel):
                 await storage.update_record_tags(record, record.tags)
                 new_record = False
         finally:
-            params = {self.RECORD_TYPE: self.serialize()}
-            if log_params:
-                params.update(log_params)
             if new_record is None:
                 log_reason = f"FAILED: {log_reason}"
-            self.log_state(context, log_reason, params, override=log_override)
+            if self.log_state_enabled(context, log_override):
+                # serialize only when the state log will actually print
+                params = {self.RECORD_TYPE: self.serialize()}
+                if log_params:
+                    params.update(log_params)
+                self.log_state(context, log_reason, params, override=log_override)
 
         await self.post_save(context, new_record, self._last_state, webhook)
         self._last_state = self.state
@@ -378,6 +384,16 @@ class BaseRecord(BaseModel):
         if responder:
             await responder.send_webhook(topic, payload)
 
+    @classmethod
+    def log_state_enabled(
+        cls, context: InjectionContext, override: bool = False
+    ) -> bool:
+        """Check whether log_state() would produce output for this record type."""
+        return bool(
+            override
+            or (cls.LOG_STATE_FLAG and context.settings.get(cls.LOG_STATE_FLAG))
+        )
+
     @classmethod
     def log_state(
         cls,
@@ -387,9 +403,7 @@ class BaseRecord(BaseModel):
         override: bool = False,
     ):
         """Print a message with increased visibility (for testing)."""
-        if override or (
-            cls.LOG_STATE_FLAG and context.settings.get(cls.LOG_STATE_FLAG)
-        ):
+        if cls.log_state_enabled(context, override):
             out = msg + "\n"
             if params:
                 for k, v in params.items():
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from marshmallow import fields
+
+from ..base import BaseModel, BaseModelSchema
+
+
+class ModelImpl(BaseModel):
+    class Meta:
+        schema_class = "SchemaImpl"
+
+    def __init__(self, *, attr=None):
+        super().__init__()
+        self.attr = attr
+
+
+class SchemaImpl(BaseModelSchema):
+    class Meta:
+        model_class = ModelImpl
+
+    attr = fields.String(required=True)
+
+
+class TestBaseModel(TestCase):
+    """Base model tests."""
+
+    def test_deserialize_dict_retains_orig(self):
+        obj = {"attr": "succeeds"}
+        model = ModelImpl.deserialize(obj)
+        assert model._orig_dict == {"attr": "succeeds"}
+
+        assert model._orig_dict is not obj
+        obj["attr"] = "mutated"
+        assert model._orig_dict == {"attr": "succeeds"}
+
+    def test_deserialize_str_no_orig(self):
+        model = ModelImpl.deserialize('{"attr": "succeeds"}')
+        assert model.attr == "succeeds"
+        assert model._orig_dict is None
+
+    def test_serialize(self):
+        model = ModelImpl(attr="succeeds")
+        assert model._orig_dict is None
+        assert model.serialize() == {"attr": "succeeds"}
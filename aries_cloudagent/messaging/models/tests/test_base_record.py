@@ -173,6 +173,54 @@ class TestBaseRecord(AsyncTestCase):
         record.log_state(context, "state")
         mock_print.assert_not_called()
 
+    @async_mock.patch("builtins.print")
+    async def test_save_skip_serialize_when_log_disabled(self, mock_print):
+        context = InjectionContext(enforce_typing=False)
+        mock_storage = async_mock.MagicMock()
+        mock_storage.add_record = async_mock.CoroutineMock()
+        context.injector.bind_instance(BaseStorage, mock_storage)
+        record = BaseRecordImpl()
+        with async_mock.patch.object(
+            record, "serialize", async_mock.MagicMock()
+        ) as mock_serialize:
+            await record.save(context, reason="reason", webhook=False)
+        mock_serialize.assert_not_called()
+        mock_print.assert_not_called()
+
+    @async_mock.patch("builtins.print")
+    async def test_save_log_state_flag(self, mock_print):
+        test_param = "test.log"
+        context = InjectionContext(
+            settings={test_param: 1}, enforce_typing=False
+        )
+        mock_storage = async_mock.MagicMock()
+        mock_storage.add_record = async_mock.CoroutineMock()
+        context.injector.bind_instance(BaseStorage, mock_storage)
+        with async_mock.patch.object(
+            BaseRecordImpl, "LOG_STATE_FLAG", test_param
+        ):
+            record = BaseRecordImpl()
+            await record.save(
+                context,
+                reason="reason",
+                log_params={"log": "param"},
+                webhook=False,
+            )
+        mock_print.assert_called_once()
+        assert "log: param" in mock_print.call_args[0][0]
+
+    @async_mock.patch("builtins.print")
+    async def test_save_log_override(self, mock_print):
+        context = InjectionContext(enforce_typing=False)
+        mock_storage = async_mock.MagicMock()
+        mock_storage.add_record = async_mock.CoroutineMock()
+        context.injector.bind_instance(BaseStorage, mock_storage)
+        record = BaseRecordImpl()
+        await record.save(
+            context, reason="reason", log_override=True, webhook=False
+        )
+        mock_print.assert_called_once()
+
     async def test_webhook(self):
         context = InjectionContext()
         mock_responder = MockResponder()
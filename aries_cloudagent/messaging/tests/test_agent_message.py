@@ -37,10 +37,17 @@ class BasicAgentMessage(AgentMessage):
     class Meta:
         """Meta data"""
 
-        schema_class = "AgentMessageSchema"
+        schema_class = "BasicAgentMessageSchema"
         message_type = "basic-message"
 
 
+class BasicAgentMessageSchema(AgentMessageSchema):
+    """Utility schema"""
+
+    class Meta:
+        model_class = BasicAgentMessage
+
+
 class TestAgentMessage(AsyncTestCase):
     """Tests agent message."""
 
@@ -79,6 +86,17 @@ class TestAgentMessage(AsyncTestCase):
         assert isinstance(loaded, SignedAgentMessage)
         assert await loaded.verify_signed_field("value", wallet) == key_info.verkey
 
+    async def test_extract_decorators_leaves_source_dict(self):
+        msg = BasicAgentMessage()
+        payload = msg.serialize()
+        payload["~thread"] = {"thid": msg._id}
+        source = dict(payload)
+
+        loaded = BasicAgentMessage.deserialize(payload)
+        assert loaded._thread_id == msg._id
+        assert payload == source  # decorator extraction must not mutate input
+        assert loaded._orig_dict == source
+
     async def test_assign_thread(self):
         msg = BasicAgentMessage()
         assert msg._thread_id == msg._id
@@ -1,5 +1,6 @@
 """Classes to manage connections."""
 
+import asyncio
 import logging
 
 from typing import Sequence, Tuple
@@ -917,8 +918,7 @@ class ConnectionManager:
         keys = await storage.search_records(
             self.RECORD_TYPE_DID_KEY, {"did": did}
         ).fetch_all()
-        for record in keys:
-            await storage.delete_record(record)
+        await asyncio.gather(*(storage.delete_record(record) for record in keys))
 
     async def get_connection_targets(
         self, *, connection_id: str = None, connection: ConnectionRecord = None
@@ -986,8 +986,11 @@ class ConnectionManager:
                         "Cannot resolve DID without ledger instance"
                     )
                 async with ledger:
-                    endpoint = await ledger.get_endpoint_for_did(invitation.did)
-                    recipient_keys = [await ledger.get_key_for_did(invitation.did)]
+                    endpoint, recipient_key = await asyncio.gather(
+                        ledger.get_endpoint_for_did(invitation.did),
+                        ledger.get_key_for_did(invitation.did),
+                    )
+                    recipient_keys = [recipient_key]
                     routing_keys = []
             else:
                 endpoint = invitation.endpoint
@@ -13,4 +13,4 @@ class DiscloseHandler(BaseHandler):
         self._logger.debug("DiscloseHandler called with context %s", context)
         assert isinstance(context.message, Disclose)
 
-        print("Received protocols:\n{}".format(context.message.protocols))
+        self._logger.info("Received protocols: %s", context.message.protocols)
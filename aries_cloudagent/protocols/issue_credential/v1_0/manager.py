@@ -56,16 +56,33 @@ class CredentialManager:
     async def _match_sent_cred_def_id(self, tag_query: Mapping[str, str]) -> str:
         """Return most recent matching id of cred def that agent sent to ledger."""
 
-        storage: BaseStorage = await self.context.inject(BaseStorage)
-        found = await storage.search_records(
-            type_filter=CRED_DEF_SENT_RECORD_TYPE,
-            tag_query=tag_query,
-        ).fetch_all()
-        if not found:
-            raise CredentialManagerError(
-                f"Issuer has no operable cred def for proposal spec {tag_query}"
-            )
-        return max(found, key=lambda r: int(r.tags["epoch"])).tags["cred_def_id"]
+        async def _match() -> str:
+            storage: BaseStorage = await self.context.inject(BaseStorage)
+            found = await storage.search_records(
+                type_filter=CRED_DEF_SENT_RECORD_TYPE,
+                tag_query=tag_query,
+            ).fetch_all()
+            if not found:
+                raise CredentialManagerError(
+                    f"Issuer has no operable cred def for proposal spec {tag_query}"
+                )
+            return max(found, key=lambda r: int(r.tags["epoch"])).tags["cred_def_id"]
+
+        cred_def_id = None
+        cache_key = "cred_def_sent::{}".format(
+            "::".join(f"{t}::{tag_query[t]}" for t in sorted(tag_query))
+        )
+        cache: BaseCache = await self.context.inject(BaseCache, required=False)
+        if cache:
+            async with cache.acquire(cache_key) as entry:
+                if entry.result:
+                    cred_def_id = entry.result
+                else:
+                    cred_def_id = await _match()
+                    await entry.set_result(cred_def_id, 60)
+        if not cred_def_id:
+            cred_def_id = await _match()
+        return cred_def_id
 
     async def prepare_send(
         self, connection_id: str, credential_proposal: CredentialProposal
@@ -307,6 +307,102 @@ class TestCredentialManager(AsyncTestCase):
                     credential_exchange_record=exchange, comment=comment
                 )
 
+    async def test_match_sent_cred_def_id_cached(self):
+        TEST_DID = "LjgpST2rjsoxYegQDRm7EL"
+        schema_id = f"{TEST_DID}:2:bc-reg:1.0"
+        schema_id_parts = schema_id.split(":")
+        cred_def_id = f"{TEST_DID}:3:CL:18:tag"
+        tag_query = {"cred_def_id": cred_def_id}
+
+        self.cache = BasicCache()
+        self.context.injector.bind_instance(BaseCache, self.cache)
+
+        self.storage = BasicStorage()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+        cred_def_record = StorageRecord(
+            CRED_DEF_SENT_RECORD_TYPE,
+            cred_def_id,
+            {
+                "schema_id": schema_id,
+                "schema_issuer_did": schema_id_parts[0],
+                "schema_name": schema_id_parts[-2],
+                "schema_version": schema_id_parts[-1],
+                "issuer_did": TEST_DID,
+                "cred_def_id": cred_def_id,
+                "epoch": str(int(time())),
+            }
+        )
+        await self.storage.add_record(cred_def_record)
+
+        assert await self.manager._match_sent_cred_def_id(tag_query) == cred_def_id
+
+        with async_mock.patch.object(
+            self.storage, "search_records", autospec=True
+        ) as mock_search:
+            assert await self.manager._match_sent_cred_def_id(tag_query) == cred_def_id
+            mock_search.assert_not_called()  # second call served from cache
+
+    async def test_match_sent_cred_def_id_no_cache(self):
+        TEST_DID = "LjgpST2rjsoxYegQDRm7EL"
+        schema_id = f"{TEST_DID}:2:bc-reg:1.0"
+        schema_id_parts = schema_id.split(":")
+        cred_def_id = f"{TEST_DID}:3:CL:18:tag"
+
+        self.storage = BasicStorage()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+        cred_def_record = StorageRecord(
+            CRED_DEF_SENT_RECORD_TYPE,
+            cred_def_id,
+            {
+                "schema_id": schema_id,
+                "schema_issuer_did": schema_id_parts[0],
+                "schema_name": schema_id_parts[-2],
+                "schema_version": schema_id_parts[-1],
+                "issuer_did": TEST_DID,
+                "cred_def_id": cred_def_id,
+                "epoch": str(int(time())),
+            }
+        )
+        await self.storage.add_record(cred_def_record)
+
+        assert await self.manager._match_sent_cred_def_id(
+            {"cred_def_id": cred_def_id}
+        ) == cred_def_id
+
+    async def test_match_sent_cred_def_id_miss_not_cached(self):
+        TEST_DID = "LjgpST2rjsoxYegQDRm7EL"
+        schema_id = f"{TEST_DID}:2:bc-reg:1.0"
+        schema_id_parts = schema_id.split(":")
+        cred_def_id = f"{TEST_DID}:3:CL:18:tag"
+        tag_query = {"cred_def_id": cred_def_id}
+
+        self.cache = BasicCache()
+        self.context.injector.bind_instance(BaseCache, self.cache)
+
+        self.storage = BasicStorage()
+        self.context.injector.bind_instance(BaseStorage, self.storage)
+
+        with self.assertRaises(CredentialManagerError):
+            await self.manager._match_sent_cred_def_id(tag_query)
+
+        cred_def_record = StorageRecord(
+            CRED_DEF_SENT_RECORD_TYPE,
+            cred_def_id,
+            {
+                "schema_id": schema_id,
+                "schema_issuer_did": schema_id_parts[0],
+                "schema_name": schema_id_parts[-2],
+                "schema_version": schema_id_parts[-1],
+                "issuer_did": TEST_DID,
+                "cred_def_id": cred_def_id,
+                "epoch": str(int(time())),
+            }
+        )
+        await self.storage.add_record(cred_def_record)
+
+        # the miss above must not have poisoned the cache
+        assert await self.manager._match_sent_cred_def_id(tag_query) == cred_def_id
+
     async def test_receive_offer_proposed(self):
         schema_id = "LjgpST2rjsoxYegQDRm7EL:2:bc-reg:1.0"
         cred_def_id = "LjgpST2rjsoxYegQDRm7EL:3:CL:18:tag"
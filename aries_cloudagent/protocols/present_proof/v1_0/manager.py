@@ -1,6 +1,6 @@
 """Classes to manage presentations."""
 
-import json
+import asyncio
 import logging
 
 from ....config.injection_context import InjectionContext
@@ -98,7 +98,10 @@ class PresentationManager:
             initiator=V10PresentationExchange.INITIATOR_EXTERNAL,
             role=V10PresentationExchange.ROLE_VERIFIER,
             state=V10PresentationExchange.STATE_PROPOSAL_RECEIVED,
-            presentation_proposal_dict=presentation_proposal_message.serialize(),
+            presentation_proposal_dict=(
+                presentation_proposal_message._orig_dict  # as received, if inbound
+                or presentation_proposal_message.serialize()
+            ),
         )
         await presentation_exchange_record.save(
             self.context, reason="receive presentation request"
@@ -129,12 +132,17 @@ class PresentationManager:
             A tuple (updated presentation exchange record, presentation request message)
 
         """
+        presentation_proposal_message = (
+            presentation_exchange_record.presentation_proposal_message
+        )
+        if not presentation_proposal_message:
+            raise PresentationManagerError(
+                "Presentation exchange record has no presentation proposal"
+            )
         indy_proof_request = await (
-            PresentationProposal.deserialize(
-                presentation_exchange_record.presentation_proposal_dict
+            presentation_proposal_message.presentation_proposal.indy_proof_request(
+                name=name, version=version, nonce=nonce
             )
-        ).presentation_proposal.indy_proof_request(
-            name=name, version=version, nonce=nonce
         )
 
         presentation_request_message = PresentationRequest(
@@ -250,48 +258,45 @@ class PresentationManager:
             A tuple (updated presentation exchange record, presentation message)
 
         """
-        # Get all credential ids for this presentation
-        credential_ids = []
+        # Get distinct credential ids for this presentation
+        credential_ids = set()
 
-        requested_attributes = requested_credentials["requested_attributes"]
-        for presentation_referent in requested_attributes:
-            credential_id = requested_attributes[presentation_referent]["cred_id"]
-            credential_ids.append(credential_id)
+        for attr_spec in requested_credentials["requested_attributes"].values():
+            credential_ids.add(attr_spec["cred_id"])
 
-        requested_predicates = requested_credentials["requested_predicates"]
-        for presentation_referent in requested_predicates:
-            credential_id = requested_predicates[presentation_referent]["cred_id"]
-            credential_ids.append(credential_id)
+        for pred_spec in requested_credentials["requested_predicates"].values():
+            credential_ids.add(pred_spec["cred_id"])
 
-        # Get all schema and credential definition ids in use
+        # Get distinct schema and credential definition ids in use: fetch in parallel
         # TODO: Cache this!!!
-        schema_ids = []
-        credential_definition_ids = []
         holder: BaseHolder = await self.context.inject(BaseHolder)
-        for credential_id in credential_ids:
-            credential = await holder.get_credential(credential_id)
-            schema_id = credential["schema_id"]
-            credential_definition_id = credential["cred_def_id"]
-            schema_ids.append(schema_id)
-            credential_definition_ids.append(credential_definition_id)
+        credentials = await asyncio.gather(
+            *(holder.get_credential(credential_id) for credential_id in credential_ids)
+        )
+        schema_ids = {credential["schema_id"] for credential in credentials}
+        credential_definition_ids = {
+            credential["cred_def_id"] for credential in credentials
+        }
 
-        schemas = {}
-        credential_definitions = {}
+        schema_ids = list(schema_ids)
+        credential_definition_ids = list(credential_definition_ids)
 
         ledger: BaseLedger = await self.context.inject(BaseLedger)
         async with ledger:
 
-            # Build schemas for anoncreds
-            for schema_id in schema_ids:
-                schema = await ledger.get_schema(schema_id)
-                schemas[schema_id] = schema
-
-            # Build credential_definitions for anoncreds
-            for credential_definition_id in credential_definition_ids:
-                (credential_definition) = await ledger.get_credential_definition(
-                    credential_definition_id
-                )
-                credential_definitions[credential_definition_id] = credential_definition
+            # Build schemas and credential_definitions for anoncreds: the two
+            # phases have no data dependency, so fetch all in one parallel batch
+            results = await asyncio.gather(
+                *(ledger.get_schema(schema_id) for schema_id in schema_ids),
+                *(
+                    ledger.get_credential_definition(credential_definition_id)
+                    for credential_definition_id in credential_definition_ids
+                ),
+            )
+            schemas = dict(zip(schema_ids, results[: len(schema_ids)]))
+            credential_definitions = dict(
+                zip(credential_definition_ids, results[len(schema_ids):])
+            )
 
         holder: BaseHolder = await self.context.inject(BaseHolder)
         indy_proof = await holder.create_presentation(
@@ -331,11 +336,13 @@ class PresentationManager:
             presentation exchange record, retrieved and updated
 
         """
-        presentation = self.context.message.indy_proof()
-        thread_id = self.context.message._thread_id
+        message = self.context.message
+        presentation = message.indy_proof()
+        thread_id = message._thread_id
+        connection_record = self.context.connection_record
         connection_id_filter = (
-            {"connection_id": self.context.connection_record.connection_id}
-            if self.context.connection_record is not None
+            {"connection_id": connection_record.connection_id}
+            if connection_record is not None
             else None
         )
         (
@@ -372,37 +379,38 @@ class PresentationManager:
         indy_proof_request = presentation_exchange_record.presentation_request
         indy_proof = presentation_exchange_record.presentation
 
-        schema_ids = []
-        credential_definition_ids = []
-
         identifiers = indy_proof["identifiers"]
-        for identifier in identifiers:
-            schema_ids.append(identifier["schema_id"])
-            credential_definition_ids.append(identifier["cred_def_id"])
+        schema_ids = {identifier["schema_id"] for identifier in identifiers}
+        credential_definition_ids = {
+            identifier["cred_def_id"] for identifier in identifiers
+        }
 
-        schemas = {}
-        credential_definitions = {}
+        schema_ids = list(schema_ids)
+        credential_definition_ids = list(credential_definition_ids)
 
         ledger: BaseLedger = await self.context.inject(BaseLedger)
         async with ledger:
 
-            # Build schemas for anoncreds
-            for schema_id in schema_ids:
-                schema = await ledger.get_schema(schema_id)
-                schemas[schema_id] = schema
-
-            # Build credential_definitions for anoncreds
-            for credential_definition_id in credential_definition_ids:
-                (credential_definition) = await ledger.get_credential_definition(
-                    credential_definition_id
-                )
-                credential_definitions[credential_definition_id] = credential_definition
+            # Build schemas and credential_definitions for anoncreds: the two
+            # phases have no data dependency, so fetch all in one parallel batch
+            results = await asyncio.gather(
+                *(ledger.get_schema(schema_id) for schema_id in schema_ids),
+                *(
+                    ledger.get_credential_definition(credential_definition_id)
+                    for credential_definition_id in credential_definition_ids
+                ),
+            )
+            schemas = dict(zip(schema_ids, results[: len(schema_ids)]))
+            credential_definitions = dict(
+                zip(credential_definition_ids, results[len(schema_ids):])
+            )
 
         verifier: BaseVerifier = await self.context.inject(BaseVerifier)
-        presentation_exchange_record.verified = json.dumps(  # tag: needs string value
-            await verifier.verify_presentation(
-                indy_proof_request, indy_proof, schemas, credential_definitions
-            )
+        verified = await verifier.verify_presentation(
+            indy_proof_request, indy_proof, schemas, credential_definitions
+        )
+        presentation_exchange_record.verified = (  # tag: needs string value
+            "true" if verified else "false"
         )
         presentation_exchange_record.state = V10PresentationExchange.STATE_VERIFIED
 
@@ -423,19 +431,18 @@ class PresentationManager:
             presentation_exchange_record: presentation exchange record with thread id
 
         """
+        thread_id = presentation_exchange_record.thread_id
         responder = await self.context.inject(BaseResponder, required=False)
 
         if responder:
             presentation_ack_message = PresentationAck()
-            presentation_ack_message._thread = {
-                "thid": presentation_exchange_record.thread_id
-            }
+            presentation_ack_message._thread = {"thid": thread_id}
 
             await responder.send_reply(presentation_ack_message)
         else:
             self._logger.warning(
                 "Configuration has no BaseResponder: cannot ack presentation on %s",
-                presentation_exchange_record.thread_id,
+                thread_id,
             )
 
     async def receive_presentation_ack(self):
@@ -446,12 +453,13 @@ class PresentationManager:
             presentation exchange record, retrieved and updated
 
         """
+        context = self.context
         (
             presentation_exchange_record
         ) = await V10PresentationExchange.retrieve_by_tag_filter(
-            self.context,
-            {"thread_id": self.context.message._thread_id},
-            {"connection_id": self.context.connection_record.connection_id}
+            context,
+            {"thread_id": context.message._thread_id},
+            {"connection_id": context.connection_record.connection_id}
         )
 
         presentation_exchange_record.state = (
@@ -270,20 +270,20 @@ class PresentationPreview(BaseModel):
             nonlocal epoch_now
             nonlocal timestamps
 
-            return (timestamps or {}).get(cred_def_id, epoch_now)
+            return timestamps.get(cred_def_id, epoch_now)
 
         def ord_cred_def_id(cred_def_id: str):
             """Ordinal for cred def id to use in suggestive proof req referent."""
 
             nonlocal cred_def_ids
 
-            if cred_def_id in cred_def_ids:
-                return cred_def_ids.index(cred_def_id)
-            cred_def_ids.append(cred_def_id)
-            return len(cred_def_ids) - 1
+            if cred_def_id not in cred_def_ids:
+                cred_def_ids[cred_def_id] = len(cred_def_ids)
+            return cred_def_ids[cred_def_id]
 
         epoch_now = int(time())  # TODO: take cred_def_id->timestamp here, default now
-        cred_def_ids = []
+        timestamps = timestamps or {}
+        cred_def_ids = {}  # map cred def id to ordinal of first appearance
 
         proof_req = {
             "name": name or "proof-request",
@@ -327,7 +327,7 @@ class PresentationPreview(BaseModel):
                 and await ledger.get_credential_definition(cd_id)["value"]["revocation"]
             )
 
-            timestamp = non_revo(attr_spec.cred_def_id)
+            timestamp = non_revo(pred_spec.cred_def_id)
             proof_req["requested_predicates"][
                 "{}_{}_{}_uuid".format(
                     ord_cred_def_id(cd_id),
@@ -356,6 +356,76 @@ class TestPresentationPreviewAsync(AsyncTestCase):
             for attr_spec in indy_proof_req_selfie["requested_attributes"].values()
         )
 
+    @pytest.mark.asyncio
+    async def test_to_indy_proof_request_revo_by_cred_def_id(self):
+        """Test each referent takes the non-revocation timestamp of its cred def."""
+
+        S_ID_2 = "NcYxiDXkpYi6ov5FcYDi1e:2:tails:1.0"
+        CD_ID_2 = f"NcYxiDXkpYi6ov5FcYDi1e:3:CL:{S_ID_2}:tag1"
+        pres_preview = PresentationPreview(
+            attributes=[
+                PresAttrSpec(
+                    name="player",
+                    cred_def_id=CD_ID,
+                    value="Richie Knucklez"
+                )
+            ],
+            predicates=[
+                PresPredSpec(
+                    name="highScore",
+                    cred_def_id=CD_ID_2,
+                    predicate=">=",
+                    threshold=1000000
+                )
+            ]
+        )
+
+        def get_credential_definition(cred_def_id):
+            async def _revocation():
+                return True
+
+            return {"value": {"revocation": _revocation()}}
+
+        ledger = async_mock.MagicMock(
+            get_credential_definition=get_credential_definition
+        )
+        timestamps = {CD_ID: 1234567890, CD_ID_2: 1234567999}
+
+        indy_proof_req = await pres_preview.indy_proof_request(
+            **{k: INDY_PROOF_REQ[k] for k in ("name", "version", "nonce")},
+            ledger=ledger,
+            timestamps=timestamps,
+        )
+
+        assert indy_proof_req["requested_attributes"]["0_player_uuid"][
+            "non_revoked"
+        ] == {"from": timestamps[CD_ID], "to": timestamps[CD_ID]}
+        assert indy_proof_req["requested_predicates"]["1_highscore_GE_uuid"][
+            "non_revoked"
+        ] == {"from": timestamps[CD_ID_2], "to": timestamps[CD_ID_2]}
+
+    @pytest.mark.asyncio
+    async def test_to_indy_proof_request_predicates_only(self):
+        """Test presentation preview with predicates but no attributes."""
+
+        pres_preview = PresentationPreview(
+            predicates=[
+                PresPredSpec(
+                    name="highScore",
+                    cred_def_id=CD_ID,
+                    predicate=">=",
+                    threshold=1000000
+                )
+            ]
+        )
+
+        indy_proof_req = await pres_preview.indy_proof_request(
+            **{k: INDY_PROOF_REQ[k] for k in ("name", "version", "nonce")}
+        )
+
+        assert not indy_proof_req["requested_attributes"]
+        assert set(indy_proof_req["requested_predicates"]) == {"0_highscore_GE_uuid"}
+
     @pytest.mark.asyncio
     async def test_satisfaction(self):
         """Test presentation preview predicate satisfaction."""
@@ -6,6 +6,8 @@ from marshmallow.validate import OneOf
 from .....messaging.models.base_record import BaseRecord, BaseRecordSchema
 from .....messaging.valid import UUIDFour
 
+from ..messages.presentation_proposal import PresentationProposal
+
 
 class V10PresentationExchange(BaseRecord):
     """Represents an Aries#0037 v1.0 presentation exchange."""
@@ -59,6 +61,7 @@ class V10PresentationExchange(BaseRecord):
         self.initiator = initiator
         self.role = role
         self.state = state
+        self._presentation_proposal_message = None
         self.presentation_proposal_dict = presentation_proposal_dict
         self.presentation_request = presentation_request  # indy proof req
         self.presentation = presentation  # indy proof
@@ -71,6 +74,35 @@ class V10PresentationExchange(BaseRecord):
         """Accessor for the ID associated with this exchange."""
         return self._id
 
+    @property
+    def presentation_proposal_dict(self) -> dict:
+        """Accessor for serialized presentation proposal message."""
+        return self._presentation_proposal_dict
+
+    @presentation_proposal_dict.setter
+    def presentation_proposal_dict(self, value: dict):
+        """Setter for serialized presentation proposal message."""
+        self._presentation_proposal_dict = value
+        self._presentation_proposal_message = None
+
+    @property
+    def presentation_proposal_message(self) -> PresentationProposal:
+        """
+        Accessor for deserialized presentation proposal message.
+
+        Deserializes presentation_proposal_dict on first access and memoizes
+        the result until the dict changes: deserialization is expensive enough
+        to avoid repeating per handler on the same exchange.
+        """
+        if (
+            self._presentation_proposal_message is None
+            and self._presentation_proposal_dict is not None
+        ):
+            self._presentation_proposal_message = PresentationProposal.deserialize(
+                self._presentation_proposal_dict
+            )
+        return self._presentation_proposal_message
+
     @property
     def record_value(self) -> dict:
         """Accessor for JSON record value generated for this presentation exchange."""
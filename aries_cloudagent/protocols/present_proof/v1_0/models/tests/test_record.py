@@ -1,5 +1,8 @@
 from unittest import TestCase as UnitTestCase
 
+from asynctest import mock as async_mock
+
+from ...messages.presentation_proposal import PresentationProposal
 from ..presentation_exchange import V10PresentationExchange
 
 
@@ -34,3 +37,36 @@ class TestRecord(UnitTestCase):
             "error_msg": "error",
             "verified": False,
         }
+
+    def test_presentation_proposal_message_memoized(self):
+        proposal_dict = PresentationProposal().serialize()
+        record = V10PresentationExchange(
+            presentation_proposal_dict=proposal_dict,
+        )
+
+        message = record.presentation_proposal_message
+        assert isinstance(message, PresentationProposal)
+
+        with async_mock.patch.object(
+            PresentationProposal, "deserialize", autospec=True
+        ) as mock_deserialize:
+            assert record.presentation_proposal_message is message
+            mock_deserialize.assert_not_called()  # no repeat deserialization
+
+    def test_presentation_proposal_dict_set_clears_memo(self):
+        record = V10PresentationExchange(
+            presentation_proposal_dict=PresentationProposal().serialize(),
+        )
+        message = record.presentation_proposal_message
+
+        replacement_dict = PresentationProposal().serialize()
+        record.presentation_proposal_dict = replacement_dict
+
+        replacement_message = record.presentation_proposal_message
+        assert replacement_message is not message
+        assert replacement_message._id == replacement_dict["@id"]
+
+    def test_presentation_proposal_message_unset(self):
+        record = V10PresentationExchange()
+        assert record.presentation_proposal_dict is None
+        assert record.presentation_proposal_message is None
@@ -242,6 +242,32 @@ class V10PresentationRequestSchema(Schema):
     )
 
 
+async def retrieve_presentation_exchange(
+    request: web.BaseRequest,
+) -> V10PresentationExchange:
+    """
+    Fetch the presentation exchange record that a request's pres_ex_id selects.
+
+    Args:
+        request: aiohttp request object
+
+    Returns:
+        The presentation exchange record
+
+    Raises:
+        web.HTTPNotFound: If no record matches the presentation exchange id
+
+    """
+    context = request.app["request_context"]
+    presentation_exchange_id = request.match_info["pres_ex_id"]
+    try:
+        return await V10PresentationExchange.retrieve_by_id(
+            context, presentation_exchange_id
+        )
+    except StorageNotFoundError:
+        raise web.HTTPNotFound()
+
+
 @docs(tags=["present-proof"], summary="Fetch all present-proof exchange records")
 @response_schema(V10PresentationExchangeListSchema(), 200)
 async def presentation_exchange_list(request: web.BaseRequest):
@@ -280,14 +306,7 @@ async def presentation_exchange_retrieve(request: web.BaseRequest):
         The presentation exchange record response
 
     """
-    context = request.app["request_context"]
-    presentation_exchange_id = request.match_info["pres_ex_id"]
-    try:
-        record = await V10PresentationExchange.retrieve_by_id(
-            context, presentation_exchange_id
-        )
-    except StorageNotFoundError:
-        raise web.HTTPNotFound()
+    record = await retrieve_presentation_exchange(request)
     return web.json_response(record.serialize())
 
 
@@ -332,12 +351,7 @@ async def presentation_exchange_credentials_list(request: web.BaseRequest):
     referents = request.match_info.get("referent")
     presentation_referents = referents.split(",") if referents else ()
 
-    try:
-        presentation_exchange_record = await V10PresentationExchange.retrieve_by_id(
-            context, presentation_exchange_id
-        )
-    except StorageNotFoundError:
-        raise web.HTTPNotFound()
+    presentation_exchange_record = await retrieve_presentation_exchange(request)
 
     start = request.query.get("start")
     count = request.query.get("count")
@@ -561,10 +575,7 @@ async def presentation_exchange_send_bound_request(request: web.BaseRequest):
     context = request.app["request_context"]
     outbound_handler = request.app["outbound_message_router"]
 
-    presentation_exchange_id = request.match_info["pres_ex_id"]
-    presentation_exchange_record = await V10PresentationExchange.retrieve_by_id(
-        context, presentation_exchange_id
-    )
+    presentation_exchange_record = await retrieve_presentation_exchange(request)
     assert presentation_exchange_record.state == (
         V10PresentationExchange.STATE_PROPOSAL_RECEIVED
     )
@@ -610,10 +621,7 @@ async def presentation_exchange_send_presentation(request: web.BaseRequest):
 
     context = request.app["request_context"]
     outbound_handler = request.app["outbound_message_router"]
-    presentation_exchange_id = request.match_info["pres_ex_id"]
-    presentation_exchange_record = await V10PresentationExchange.retrieve_by_id(
-        context, presentation_exchange_id
-    )
+    presentation_exchange_record = await retrieve_presentation_exchange(request)
 
     body = await request.json()
 
@@ -665,11 +673,7 @@ async def presentation_exchange_verify_presentation(request: web.BaseRequest):
 
     """
     context = request.app["request_context"]
-    presentation_exchange_id = request.match_info["pres_ex_id"]
-
-    presentation_exchange_record = await V10PresentationExchange.retrieve_by_id(
-        context, presentation_exchange_id
-    )
+    presentation_exchange_record = await retrieve_presentation_exchange(request)
     connection_id = presentation_exchange_record.connection_id
 
     try:
@@ -705,13 +709,7 @@ async def presentation_exchange_remove(request: web.BaseRequest):
 
     """
     context = request.app["request_context"]
-    presentation_exchange_id = request.match_info["pres_ex_id"]
-    try:
-        presentation_exchange_record = await V10PresentationExchange.retrieve_by_id(
-            context, presentation_exchange_id
-        )
-    except StorageNotFoundError:
-        raise web.HTTPNotFound()
+    presentation_exchange_record = await retrieve_presentation_exchange(request)
 
     await presentation_exchange_record.delete_record(context)
     return web.json_response({})
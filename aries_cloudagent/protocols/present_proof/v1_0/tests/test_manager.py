@@ -130,6 +130,56 @@ class TestPresentationManager(AsyncTestCase):
 
             assert exchange.state == V10PresentationExchange.STATE_PROPOSAL_RECEIVED
 
+    async def test_receive_proposal_stores_inbound_payload(self):
+        self.context.connection_record = async_mock.MagicMock()
+        self.context.connection_record.connection_id = CONN_ID
+
+        proposal_dict = PresentationProposal(
+            presentation_proposal=PRES_PREVIEW
+        ).serialize()
+        self.context.message = PresentationProposal.deserialize(proposal_dict)
+
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ) as save_ex, async_mock.patch.object(
+            PresentationProposal, "serialize", autospec=True
+        ) as mock_serialize:
+            exchange = await self.manager.receive_proposal()
+            save_ex.assert_called_once()
+            mock_serialize.assert_not_called()  # payload stored as received
+
+            assert exchange.presentation_proposal_dict == proposal_dict
+
+    async def test_receive_proposal_local_message_serializes(self):
+        self.context.connection_record = async_mock.MagicMock()
+        self.context.connection_record.connection_id = CONN_ID
+
+        proposal = PresentationProposal(presentation_proposal=PRES_PREVIEW)
+        self.context.message = proposal
+
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ):
+            exchange = await self.manager.receive_proposal()
+
+            assert exchange.presentation_proposal_dict == proposal.serialize()
+
+    async def test_create_exchange_for_proposal_serializes(self):
+        self.context.connection_record = async_mock.MagicMock()
+        self.context.connection_record.connection_id = CONN_ID
+
+        proposal = PresentationProposal(presentation_proposal=PRES_PREVIEW)
+        self.context.message = proposal
+
+        with async_mock.patch.object(
+            V10PresentationExchange, "save", autospec=True
+        ):
+            exchange = await self.manager.create_exchange_for_proposal(
+                CONN_ID, proposal, auto_present=None
+            )
+
+            assert exchange.presentation_proposal_dict == proposal.serialize()
+
     async def test_create_bound_request(self):
         comment = "comment"
 
@@ -149,6 +199,16 @@ class TestPresentationManager(AsyncTestCase):
         assert ret_exchange is exchange
         exchange.save.assert_called_once()
 
+    async def test_create_bound_request_no_proposal(self):
+        exchange = V10PresentationExchange(
+            role=V10PresentationExchange.ROLE_VERIFIER,
+        )
+
+        with self.assertRaises(PresentationManagerError):
+            await self.manager.create_bound_request(
+                presentation_exchange_record=exchange
+            )
+
     async def test_create_exchange_for_request(self):
         self.context.connection_record = async_mock.MagicMock()
         self.context.connection_record.connection_id = CONN_ID
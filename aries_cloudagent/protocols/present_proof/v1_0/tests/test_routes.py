@@ -480,6 +480,33 @@ class TestProofRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.presentation_exchange_send_bound_request(mock)
 
+    async def test_presentation_exchange_send_bound_request_px_rec_not_found(self):
+        mock = async_mock.MagicMock()
+        mock.json = async_mock.CoroutineMock(
+            return_value={
+                "connection_id": "dummy",
+                "comment": "dummy",
+                "proof_request": {},
+            }
+        )
+        mock.match_info = {"pres_ex_id": "dummy"}
+
+        mock.app = {
+            "outbound_message_router": async_mock.CoroutineMock(),
+            "request_context": self.mock_context,
+        }
+
+        with async_mock.patch.object(
+            test_module, "V10PresentationExchange", autospec=True
+        ) as mock_presentation_exchange:
+
+            mock_presentation_exchange.retrieve_by_id = async_mock.CoroutineMock(
+                side_effect=StorageNotFoundError
+            )
+
+            with self.assertRaises(test_module.web.HTTPNotFound):
+                await test_module.presentation_exchange_send_bound_request(mock)
+
     async def test_presentation_exchange_send_bound_request_not_ready(self):
         mock = async_mock.MagicMock()
         mock.json = async_mock.CoroutineMock(
@@ -599,6 +626,27 @@ class TestProofRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.presentation_exchange_send_presentation(mock)
 
+    async def test_presentation_exchange_send_presentation_px_rec_not_found(self):
+        mock = async_mock.MagicMock()
+        mock.json = async_mock.CoroutineMock()
+        mock.match_info = {"pres_ex_id": "dummy"}
+
+        mock.app = {
+            "outbound_message_router": async_mock.CoroutineMock(),
+            "request_context": self.mock_context,
+        }
+
+        with async_mock.patch.object(
+            test_module, "V10PresentationExchange", autospec=True
+        ) as mock_presentation_exchange:
+
+            mock_presentation_exchange.retrieve_by_id = async_mock.CoroutineMock(
+                side_effect=StorageNotFoundError
+            )
+
+            with self.assertRaises(test_module.web.HTTPNotFound):
+                await test_module.presentation_exchange_send_presentation(mock)
+
     async def test_presentation_exchange_send_presentation_not_ready(self):
         mock = async_mock.MagicMock()
         mock.json = async_mock.CoroutineMock()
@@ -693,6 +741,23 @@ class TestProofRoutes(AsyncTestCase):
             with self.assertRaises(test_module.web.HTTPBadRequest):
                 await test_module.presentation_exchange_verify_presentation(mock)
 
+    async def test_presentation_exchange_verify_presentation_px_rec_not_found(self):
+        mock = async_mock.MagicMock()
+        mock.match_info = {"pres_ex_id": "dummy"}
+
+        mock.app = {"request_context": self.mock_context}
+
+        with async_mock.patch.object(
+            test_module, "V10PresentationExchange", autospec=True
+        ) as mock_presentation_exchange:
+
+            mock_presentation_exchange.retrieve_by_id = async_mock.CoroutineMock(
+                side_effect=StorageNotFoundError
+            )
+
+            with self.assertRaises(test_module.web.HTTPNotFound):
+                await test_module.presentation_exchange_verify_presentation(mock)
+
     async def test_presentation_exchange_verify_presentation_not_ready(self):
         mock = async_mock.MagicMock()
         mock.match_info = {"pres_ex_id": "dummy"}
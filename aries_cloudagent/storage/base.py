@@ -245,7 +245,13 @@ class BaseStorageRecordSearch(ABC):
 
     async def fetch_single(self) -> StorageRecord:
         """Fetch a single query result."""
-        results = await self.fetch_all()
+        if not self.opened:
+            await self.open()
+        try:
+            # two records suffice to detect duplicates: skip fetching the rest
+            results = await self.fetch(2)
+        finally:
+            await self.close()
         if not results:
             raise StorageNotFoundError("Record not found")
         if len(results) > 1:
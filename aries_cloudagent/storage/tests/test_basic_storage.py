@@ -147,6 +147,31 @@ class TestBasicStorage:
             count += 1
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_fetch_single(self, store):
+        record = test_record()
+        await store.add_record(record)
+        search = store.search_records(record.type, {}, None)
+        found = await search.fetch_single()
+        assert found.id == record.id
+        assert not search.opened
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_missing(self, store):
+        search = store.search_records("TYPE", {}, None)
+        with pytest.raises(StorageNotFoundError):
+            await search.fetch_single()
+        assert not search.opened
+
+    @pytest.mark.asyncio
+    async def test_fetch_single_duplicate(self, store):
+        await store.add_record(test_record())
+        await store.add_record(test_record())
+        search = store.search_records("TYPE", {}, None)
+        with pytest.raises(StorageDuplicateError):
+            await search.fetch_single()
+        assert not search.opened
+
     @pytest.mark.asyncio
     async def test_closed_search(self, store):
         search = store.search_records("TYPE", {}, None)